@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import operator
+
+import sqlalchemy as sa
+
 import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
-from ibis import util
 from ibis.backends.base.sql.alchemy.datatypes import (
     ibis_type_to_sqla,
     to_sqla_type,
@@ -17,6 +21,13 @@ from ibis.backends.base.sql.compiler import ExprTranslator, QueryContext
 
 
 class AlchemyContext(QueryContext):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # translated sqlalchemy elements keyed on the operation that produced
+        # them; operations hash and compare structurally, so equal
+        # subexpressions are translated once
+        self._xlate_cache = {}
+
     def collapse(self, queries):
         if isinstance(queries, str):
             return queries
@@ -44,34 +55,56 @@ class AlchemyExprTranslator(ExprTranslator):
     context_class = AlchemyContext
 
     _bool_aggs_need_cast_to_int32 = True
+    _bool_cast_reductions = (ops.Sum, ops.Mean, ops.Min, ops.Max)
     _has_reduction_filter_syntax = False
 
     def name(self, translated, name, force=True):
         return translated.label(name)
 
+    def translate(self, expr):
+        op = expr.op()
+        # column references translate differently when subqueries are allowed
+        key = op, self.permit_subquery
+        cache = self.context._xlate_cache
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = super().translate(expr)
+            return result
+
     def get_sqla_type(self, data_type):
-        return to_sqla_type(data_type, type_map=self._type_map)
+        return self._get_sqla_type(data_type)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_sqla_type(cls, data_type):
+        # data types are immutable and hashable, and each translator class
+        # owns exactly one type map, so the class is a sufficient cache key
+        return to_sqla_type(data_type, type_map=cls._type_map)
 
     def _reduction(self, sa_func, expr):
         op = expr.op()
         arg = op.arg
+        where = op.where
         if (
             self._bool_aggs_need_cast_to_int32
-            and isinstance(op, (ops.Sum, ops.Mean, ops.Min, ops.Max))
-            and isinstance(
-                type := arg.type(),
-                dt.Boolean,
-            )
+            and isinstance(op, self._bool_cast_reductions)
+            and isinstance(type := arg.type(), dt.Boolean)
         ):
             arg = arg.cast(dt.Int32(nullable=type.nullable))
 
-        if (where := op.where) is not None:
+        if where is not None:
             if self._has_reduction_filter_syntax:
                 return sa_func(self.translate(arg)).filter(
                     self.translate(where)
                 )
             else:
-                sa_arg = self.translate(where.ifelse(arg, None))
+                # emit the CASE directly instead of translating a new
+                # where.ifelse(arg, None) expression
+                sa_arg = sa.case(
+                    [(self.translate(where), self.translate(arg))],
+                    else_=sa.null(),
+                )
         else:
             sa_arg = self.translate(arg)
 
@@ -91,14 +124,19 @@ def _nullifzero(expr):
 # This definition should now be in the registry, but there is some magic going
 # on that things fail if it's not defined here (and in the registry
 # `operator.truediv` is used.
+_divide = fixed_arity(operator.truediv, 2)
+
+
 def _true_divide(t, expr):
     op = expr.op()
-    left, right = args = op.args
+    left, right = op.args
 
-    if util.all_of(args, ir.IntegerValue):
+    if isinstance(left, ir.IntegerValue) and isinstance(
+        right, ir.IntegerValue
+    ):
         return t.translate(left.div(right.cast('double')))
 
-    return fixed_arity(lambda x, y: x / y, 2)(t, expr)
+    return _divide(t, expr)
 
 
 AlchemyExprTranslator._registry[ops.Divide] = _true_divide
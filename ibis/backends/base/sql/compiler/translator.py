@@ -241,8 +241,9 @@ class ExprTranslator:
         # The operation node type the typed expression wraps
         op = expr.op()
 
-        if type(op) in self._rewrites:  # even if type(op) is in self._registry
-            expr = self._rewrites[type(op)](expr)
+        # even if type(op) is in self._registry
+        if (rewrite := self._rewrites.get(type(op))) is not None:
+            expr = rewrite(expr)
             op = expr.op()
 
         # TODO: use op MRO for subclasses instead of this isinstance spaghetti
@@ -88,12 +88,18 @@ def df(alltypes):
     return alltypes.execute()
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def translate():
+    # the compiler itself doesn't talk to a server, but importing it goes
+    # through the backend package, which imports the driver
+    pytest.importorskip("clickhouse_driver")
     from ibis.backends.clickhouse.compiler import (
         ClickhouseCompiler,
         ClickhouseExprTranslator,
     )
 
-    context = ClickhouseCompiler.make_context()
-    return lambda expr: ClickhouseExprTranslator(expr, context).get_result()
+    def translate(expr):
+        context = ClickhouseCompiler.make_context()
+        return ClickhouseExprTranslator(expr, context).get_result()
+
+    return translate
@@ -9,102 +9,20 @@ from pytest import param
 
 import ibis
 import ibis.expr.datatypes as dt
-import ibis.expr.types as ir
 from ibis import literal as L
 
 pytest.importorskip("clickhouse_driver")
 
+# literals shared by several parametrizations below; expressions are
+# immutable so a single instance can back every case
+FOOBAR = L('foobar')
+ABCD = L('abcd')
+CLOUDERA_URL = L('https://www.cloudera.com')
+YOUTUBE_URL = L('https://www.youtube.com/watch?v=kEuEcWfewf8&t=10')
 
-@pytest.mark.parametrize(
-    ('to_type', 'expected'),
-    [
-        param('int8', 'CAST(`double_col` AS Nullable(Int8))', id="int8"),
-        param('int16', 'CAST(`double_col` AS Nullable(Int16))', id="int16"),
-        param(
-            'float32', 'CAST(`double_col` AS Nullable(Float32))', id="float32"
-        ),
-        param('float', '`double_col`', id="float"),
-        # alltypes.double_col is non-nullable
-        param(
-            dt.Float64(nullable=False),
-            'CAST(`double_col` AS Float64)',
-            id="float64",
-        ),
-    ],
-)
-def test_cast_double_col(alltypes, translate, to_type, expected):
-    expr = alltypes.double_col.cast(to_type)
-    assert translate(expr) == expected
 
-
-@pytest.mark.parametrize(
-    ('to_type', 'expected'),
-    [
-        ('int8', 'CAST(`string_col` AS Nullable(Int8))'),
-        ('int16', 'CAST(`string_col` AS Nullable(Int16))'),
-        (dt.String(nullable=False), 'CAST(`string_col` AS String)'),
-        ('timestamp', 'CAST(`string_col` AS Nullable(DateTime64(6)))'),
-        ('date', 'CAST(`string_col` AS Nullable(Date))'),
-        (
-            '!map<string, int64>',
-            'CAST(`string_col` AS Map(Nullable(String), Nullable(Int64)))',
-        ),
-        (
-            '!struct<a: string, b: int64>',
-            (
-                'CAST(`string_col` AS '
-                'Tuple(a Nullable(String), b Nullable(Int64)))'
-            ),
-        ),
-    ],
-)
-def test_cast_string_col(alltypes, translate, to_type, expected):
-    expr = alltypes.string_col.cast(to_type)
-    assert translate(expr) == expected
-
-
-@pytest.mark.parametrize(
-    'column',
-    [
-        'index',
-        'Unnamed: 0',
-        'id',
-        'bool_col',
-        'tinyint_col',
-        'smallint_col',
-        'int_col',
-        'bigint_col',
-        'float_col',
-        'double_col',
-        'date_string_col',
-        'string_col',
-        'timestamp_col',
-        'year',
-        'month',
-    ],
-)
-def test_noop_cast(alltypes, translate, column):
-    col = alltypes[column]
-    result = col.cast(col.type())
-    assert result.equals(col)
-    assert translate(result) == f'`{column}`'
-
-
-def test_timestamp_cast(alltypes, translate):
-    target = dt.Timestamp(nullable=False)
-    result1 = alltypes.timestamp_col.cast(target)
-    result2 = alltypes.int_col.cast(target)
-
-    assert isinstance(result1, ir.TimestampColumn)
-    assert isinstance(result2, ir.TimestampColumn)
-
-    assert translate(result1) == 'CAST(`timestamp_col` AS DateTime64(6))'
-    assert translate(result2) == 'CAST(`int_col` AS DateTime64(6))'
-
-
-def test_timestamp_now(translate):
-    expr = ibis.now()
-    assert translate(expr) == 'now()'
+def _isnull(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
 
 
 @pytest.mark.parametrize(
@@ -121,7 +39,7 @@ def test_timestamp_now(translate):
 def test_timestamp_truncate(con, unit, expected):
     stamp = ibis.timestamp('2009-05-17 12:34:56')
     expr = stamp.truncate(unit)
-    assert con.execute(expr) == pd.Timestamp(expected)
+    assert con.execute(expr) == datetime.fromisoformat(expected)
 
 
 @pytest.mark.parametrize(
@@ -148,7 +66,7 @@ def test_simple_datetime_operations(con, func, expected):
 def test_nullifzero(con, value, expected):
     result = con.execute(L(value).nullifzero())
     if expected is None:
-        assert pd.isnull(result)
+        assert _isnull(result)
     else:
         assert result == expected
 
@@ -190,7 +108,7 @@ def test_coalesce(con, expr, expected):
 def test_fillna_nullif(con, expr, expected):
     result = con.execute(expr)
     if expected is None:
-        assert pd.isnull(result)
+        assert _isnull(result)
     else:
         assert result == expected
 
@@ -267,9 +185,9 @@ def test_string_lenght(con):
 @pytest.mark.parametrize(
     ('value', 'op', 'expected'),
     [
-        (L('foobar'), methodcaller('contains', 'bar'), True),
-        (L('foobar'), methodcaller('contains', 'foo'), True),
-        (L('foobar'), methodcaller('contains', 'baz'), False),
+        (FOOBAR, methodcaller('contains', 'bar'), True),
+        (FOOBAR, methodcaller('contains', 'foo'), True),
+        (FOOBAR, methodcaller('contains', 'baz'), False),
         (L('100%'), methodcaller('contains', '%'), True),
         (L('a_b_c'), methodcaller('contains', '_'), True),
     ],
@@ -309,18 +227,10 @@ def test_string_column_find_in_set(con, alltypes, translate):
 @pytest.mark.parametrize(
     ('url', 'extract', 'expected'),
     [
-        (L('https://www.cloudera.com'), 'HOST', 'www.cloudera.com'),
-        (L('https://www.cloudera.com'), 'PROTOCOL', 'https'),
-        (
-            L('https://www.youtube.com/watch?v=kEuEcWfewf8&t=10'),
-            'PATH',
-            '/watch',
-        ),
-        (
-            L('https://www.youtube.com/watch?v=kEuEcWfewf8&t=10'),
-            'QUERY',
-            'v=kEuEcWfewf8&t=10',
-        ),
+        (CLOUDERA_URL, 'HOST', 'www.cloudera.com'),
+        (CLOUDERA_URL, 'PROTOCOL', 'https'),
+        (YOUTUBE_URL, 'PATH', '/watch'),
+        (YOUTUBE_URL, 'QUERY', 'v=kEuEcWfewf8&t=10'),
     ],
 )
 def test_parse_url(con, url, extract, expected):
@@ -329,7 +239,7 @@ def test_parse_url(con, url, extract, expected):
 
 
 def test_parse_url_query_parameter(con):
-    url = L('https://www.youtube.com/watch?v=kEuEcWfewf8&t=10')
+    url = YOUTUBE_URL
     expr = url.parse_url('QUERY', 't')
     assert con.execute(expr) == '10'
 
@@ -340,15 +250,15 @@ def test_parse_url_query_parameter(con):
 @pytest.mark.parametrize(
     ('expr', 'expected'),
     [
-        (L('foobar').find('bar'), 3),
-        (L('foobar').find('baz'), -1),
-        (L('foobar').like('%bar'), True),
-        (L('foobar').like('foo%'), True),
-        (L('foobar').like('%baz%'), False),
-        (L('foobar').like(['%bar']), True),
-        (L('foobar').like(['foo%']), True),
-        (L('foobar').like(['%baz%']), False),
-        (L('foobar').like(['%bar', 'foo%']), True),
+        (FOOBAR.find('bar'), 3),
+        (FOOBAR.find('baz'), -1),
+        (FOOBAR.like('%bar'), True),
+        (FOOBAR.like('foo%'), True),
+        (FOOBAR.like('%baz%'), False),
+        (FOOBAR.like(['%bar']), True),
+        (FOOBAR.like(['foo%']), True),
+        (FOOBAR.like(['%baz%']), False),
+        (FOOBAR.like(['%bar', 'foo%']), True),
         (L('foobarfoo').replace('foo', 'H'), 'HbarH'),
     ],
 )
@@ -467,8 +377,8 @@ def test_least(con, alltypes, translate):
 @pytest.mark.parametrize(
     ('expr', 'expected'),
     [
-        (L('abcd').re_search('[a-z]'), True),
-        (L('abcd').re_search(r'[\\d]+'), False),
+        (ABCD.re_search('[a-z]'), True),
+        (ABCD.re_search(r'[\\d]+'), False),
         (L('1222').re_search(r'[\\d]+'), True),
     ],
 )
@@ -479,12 +389,12 @@ def test_regexp(con, expr, expected):
 @pytest.mark.parametrize(
     ('expr', 'expected'),
     [
-        (L('abcd').re_extract('([a-z]+)', 0), 'abcd'),
-        # (L('abcd').re_extract('(ab)(cd)', 1), 'cd'),
+        (ABCD.re_extract('([a-z]+)', 0), 'abcd'),
+        # (ABCD.re_extract('(ab)(cd)', 1), 'cd'),
         # valid group number but no match => empty string
-        (L('abcd').re_extract(r'(\\d)', 0), ''),
+        (ABCD.re_extract(r'(\\d)', 0), ''),
         # match but not a valid group number => NULL
-        # (L('abcd').re_extract('abcd', 3), None),
+        # (ABCD.re_extract('abcd', 3), None),
     ],
 )
 def test_regexp_extract(con, expr, expected):
@@ -552,29 +462,3 @@ def test_count_distinct_with_filter(alltypes):
     expected = alltypes.string_col.execute()
     expected = expected[expected.astype('int64') > 1].nunique()
     assert result == expected
-
-
-@pytest.mark.parametrize(
-    ('sep', 'where_case', 'expected'),
-    [
-        (
-            ',',
-            None,
-            "CASE WHEN empty(groupArray(`string_col`)) THEN NULL ELSE arrayStringConcat(groupArray(`string_col`), ',') END",  # noqa: E501
-        ),
-        (
-            '-',
-            None,
-            "CASE WHEN empty(groupArray(`string_col`)) THEN NULL ELSE arrayStringConcat(groupArray(`string_col`), '-') END",  # noqa: E501
-        ),
-        pytest.param(
-            ',',
-            0,
-            "CASE WHEN empty(groupArrayIf(`string_col`, `bool_col` = 0)) THEN NULL ELSE arrayStringConcat(groupArrayIf(`string_col`, `bool_col` = 0), ',') END",  # noqa: E501
-        ),
-    ],
-)
-def test_group_concat(alltypes, sep, where_case, expected, translate):
-    where = None if where_case is None else alltypes.bool_col == where_case
-    expr = alltypes.string_col.group_concat(sep, where)
-    assert translate(expr) == expected
@@ -0,0 +1,155 @@
+import pytest
+from pytest import param
+
+import ibis
+import ibis.expr.datatypes as dt
+import ibis.expr.types as ir
+
+
+@pytest.fixture(scope='module')
+def alltypes_schema_table():
+    # translation doesn't need a server, only the shape of the test table
+    return ibis.table(
+        [
+            ('index', 'int64'),
+            ('Unnamed: 0', 'int64'),
+            ('id', 'int32'),
+            ('bool_col', 'uint8'),
+            ('tinyint_col', 'int8'),
+            ('smallint_col', 'int16'),
+            ('int_col', 'int32'),
+            ('bigint_col', 'int64'),
+            ('float_col', 'float32'),
+            ('double_col', 'float64'),
+            ('date_string_col', 'string'),
+            ('string_col', 'string'),
+            ('timestamp_col', 'timestamp'),
+            ('year', 'int32'),
+            ('month', 'int32'),
+        ],
+        name='functional_alltypes',
+    )
+
+
+@pytest.mark.parametrize(
+    ('to_type', 'expected'),
+    [
+        param('int8', 'CAST(`double_col` AS Nullable(Int8))', id="int8"),
+        param('int16', 'CAST(`double_col` AS Nullable(Int16))', id="int16"),
+        param(
+            'float32', 'CAST(`double_col` AS Nullable(Float32))', id="float32"
+        ),
+        param('float', '`double_col`', id="float"),
+        # alltypes_schema_table.double_col is non-nullable
+        param(
+            dt.Float64(nullable=False),
+            'CAST(`double_col` AS Float64)',
+            id="float64",
+        ),
+    ],
+)
+def test_cast_double_col(alltypes_schema_table, translate, to_type, expected):
+    expr = alltypes_schema_table.double_col.cast(to_type)
+    assert translate(expr) == expected
+
+
+@pytest.mark.parametrize(
+    ('to_type', 'expected'),
+    [
+        ('int8', 'CAST(`string_col` AS Nullable(Int8))'),
+        ('int16', 'CAST(`string_col` AS Nullable(Int16))'),
+        (dt.String(nullable=False), 'CAST(`string_col` AS String)'),
+        ('timestamp', 'CAST(`string_col` AS Nullable(DateTime64(6)))'),
+        ('date', 'CAST(`string_col` AS Nullable(Date))'),
+        (
+            '!map<string, int64>',
+            'CAST(`string_col` AS Map(Nullable(String), Nullable(Int64)))',
+        ),
+        (
+            '!struct<a: string, b: int64>',
+            (
+                'CAST(`string_col` AS '
+                'Tuple(a Nullable(String), b Nullable(Int64)))'
+            ),
+        ),
+    ],
+)
+def test_cast_string_col(alltypes_schema_table, translate, to_type, expected):
+    expr = alltypes_schema_table.string_col.cast(to_type)
+    assert translate(expr) == expected
+
+
+@pytest.mark.parametrize(
+    'column',
+    [
+        'index',
+        'Unnamed: 0',
+        'id',
+        'bool_col',
+        'tinyint_col',
+        'smallint_col',
+        'int_col',
+        'bigint_col',
+        'float_col',
+        'double_col',
+        'date_string_col',
+        'string_col',
+        'timestamp_col',
+        'year',
+        'month',
+    ],
+)
+def test_noop_cast(alltypes_schema_table, translate, column):
+    col = alltypes_schema_table[column]
+    result = col.cast(col.type())
+    assert result.equals(col)
+    assert translate(result) == f'`{column}`'
+
+
+def test_timestamp_cast(alltypes_schema_table, translate):
+    target = dt.Timestamp(nullable=False)
+    result1 = alltypes_schema_table.timestamp_col.cast(target)
+    result2 = alltypes_schema_table.int_col.cast(target)
+
+    assert isinstance(result1, ir.TimestampColumn)
+    assert isinstance(result2, ir.TimestampColumn)
+
+    assert translate(result1) == 'CAST(`timestamp_col` AS DateTime64(6))'
+    assert translate(result2) == 'CAST(`int_col` AS DateTime64(6))'
+
+
+def test_timestamp_now(translate):
+    expr = ibis.now()
+    assert translate(expr) == 'now()'
+
+
+@pytest.mark.parametrize(
+    ('sep', 'where_case', 'expected'),
+    [
+        (
+            ',',
+            None,
+            "CASE WHEN empty(groupArray(`string_col`)) THEN NULL ELSE arrayStringConcat(groupArray(`string_col`), ',') END",  # noqa: E501
+        ),
+        (
+            '-',
+            None,
+            "CASE WHEN empty(groupArray(`string_col`)) THEN NULL ELSE arrayStringConcat(groupArray(`string_col`), '-') END",  # noqa: E501
+        ),
+        pytest.param(
+            ',',
+            0,
+            "CASE WHEN empty(groupArrayIf(`string_col`, `bool_col` = 0)) THEN NULL ELSE arrayStringConcat(groupArrayIf(`string_col`, `bool_col` = 0), ',') END",  # noqa: E501
+        ),
+    ],
+)
+def test_group_concat(
+    alltypes_schema_table, sep, where_case, expected, translate
+):
+    where = (
+        None
+        if where_case is None
+        else alltypes_schema_table.bool_col == where_case
+    )
+    expr = alltypes_schema_table.string_col.group_concat(sep, where)
+    assert translate(expr) == expected
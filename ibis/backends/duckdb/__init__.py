@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
 
 import sqlalchemy as sa
-import toolz
+from cached_property import cached_property
 
 import ibis.expr.datatypes as dt
 from ibis.backends.base.sql.alchemy.datatypes import to_sqla_type
@@ -20,6 +20,24 @@ from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
 from ibis.backends.duckdb.compiler import DuckDBSQLCompiler
 from ibis.backends.duckdb.datatypes import parse
 
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    # TODO: remove this when Python 3.9 support is dropped
+    import importlib_metadata
+
+try:
+    import pyarrow  # noqa: F401
+
+    _fetch_arrow = True
+except ImportError:
+    _fetch_arrow = False
+
+# types whose arrow -> pandas conversion yields the same values as
+# ``fetch_df``; decimals, maps, intervals, temporal and nested types come
+# back differently (Decimal objects, lists of tuples, MonthDayNano, ...)
+_ARROW_SAFE_TYPES = (dt.Boolean, dt.Integer, dt.Floating, dt.String)
+
 
 class _ColumnMetadata(NamedTuple):
     name: str
@@ -33,14 +51,9 @@ class Backend(BaseAlchemyBackend):
     def current_database(self) -> str:
         return "main"
 
-    @property
+    @cached_property
     def version(self) -> str:
         # TODO: there is a `PRAGMA version` we could use instead
-        try:
-            import importlib.metadata as importlib_metadata
-        except ImportError:
-            # TODO: remove this when Python 3.9 support is dropped
-            import importlib_metadata
         return importlib_metadata.version("duckdb")
 
     def do_connect(
@@ -63,23 +76,34 @@ class Backend(BaseAlchemyBackend):
             sa.create_engine(
                 f"duckdb:///{path}",
                 connect_args={"read_only": read_only},
+                # ibis tends to generate the same statement shapes over and
+                # over; keep more of them compiled than the default of 500
+                query_cache_size=1200,
             )
         )
         self._meta = sa.MetaData(bind=self.con)
+        # the identifier preparer memoizes quoted strings itself
+        self._quote = self.con.dialect.identifier_preparer.quote
 
     def fetch_from_cursor(
         self,
         cursor: duckdb.DuckDBPyConnection,
         schema: sch.Schema,
     ):
-        df = cursor.cursor.fetch_df()
+        if _fetch_arrow and all(
+            isinstance(typ, _ARROW_SAFE_TYPES) for typ in schema.types
+        ):
+            # split_blocks skips consolidating the columns into a single
+            # block, which would copy every column once more
+            table = cursor.cursor.fetch_arrow_table()
+            df = table.to_pandas(split_blocks=True)
+        else:
+            df = cursor.cursor.fetch_df()
         return schema.apply_to(df)
 
     def _metadata(self, query: str) -> Iterator[_ColumnMetadata]:
-        for name, type, null in toolz.pluck(
-            ["column_name", "column_type", "null"],
-            self.con.execute(f"DESCRIBE {query}"),
-        ):
+        # DESCRIBE yields column_name, column_type, null, key, default, extra
+        for name, type, null, *_ in self.con.execute(f"DESCRIBE {query}"):
             yield _ColumnMetadata(
                 name=name,
                 type=parse(type)(nullable=null.lower() == "yes"),
@@ -111,23 +135,22 @@ class Backend(BaseAlchemyBackend):
             if isinstance(col.type, sa.types.NullType)
         )
 
-        if not nulltype_cols:
-            return table
-
-        quoted_name = self.con.dialect.identifier_preparer.quote(name)
-
-        for colname, type in self._metadata(quoted_name):
-            if colname in nulltype_cols:
-                # replace null types discovered by sqlalchemy with non null
-                # types
-                table.append_column(
-                    sa.Column(
-                        colname,
-                        to_sqla_type(type),
-                        nullable=type.nullable,
-                    ),
-                    replace_existing=True,
-                )
+        if nulltype_cols:
+            quoted_name = self._quote(name)
+
+            for colname, type in self._metadata(quoted_name):
+                if colname in nulltype_cols:
+                    # replace null types discovered by sqlalchemy with non
+                    # null types
+                    table.append_column(
+                        sa.Column(
+                            colname,
+                            to_sqla_type(type),
+                            nullable=type.nullable,
+                        ),
+                        replace_existing=True,
+                    )
+
         return table
 
     def _get_temp_view_definition(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import parsy as p
@@ -48,6 +49,7 @@ from ibis.expr.datatypes import (
 )
 
 
+@functools.lru_cache(maxsize=100)
 def parse(text: str, default_decimal_parameters=(18, 3)) -> DataType:
     """Parse a DuckDB type into an ibis data type."""
     primitive = (
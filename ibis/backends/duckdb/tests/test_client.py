@@ -0,0 +1,51 @@
+import pandas.testing as tm
+import pytest
+
+import ibis
+import ibis.backends.duckdb as duckdb_backend
+
+
+def test_table_reflects_recreated_schema():
+    con = ibis.duckdb.connect()
+    con.raw_sql("CREATE TABLE t (a BIGINT)")
+    assert con.table("t").schema() == ibis.schema(dict(a="int64"))
+
+    con.raw_sql("DROP TABLE t")
+    con.raw_sql("CREATE TABLE t (a VARCHAR, b DOUBLE)")
+    assert con.table("t").schema() == ibis.schema(
+        dict(a="string", b="float64")
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        pytest.param(
+            "SELECT * FROM (VALUES (1::BIGINT, 1.5::DOUBLE, 'a', TRUE), "
+            "(NULL, NULL, NULL, NULL)) t(a, b, c, d)",
+            id="arrow_safe",
+        ),
+        pytest.param(
+            "SELECT 1.25::DECIMAL(18, 3) AS a, INTERVAL 3 DAY AS b",
+            id="decimal_interval",
+        ),
+        pytest.param(
+            "SELECT map([1, 2], ['a', 'b']) AS a",
+            id="map",
+        ),
+    ],
+)
+def test_arrow_fetch_matches_fetch_df(monkeypatch, query):
+    pytest.importorskip("pyarrow")
+
+    con = ibis.duckdb.connect()
+    con.raw_sql(f"CREATE VIEW v AS {query}")
+    expr = con.table("v")
+
+    monkeypatch.setattr(duckdb_backend, "_fetch_arrow", False)
+    expected = expr.execute()
+
+    monkeypatch.setattr(duckdb_backend, "_fetch_arrow", True)
+    result = expr.execute()
+
+    tm.assert_frame_equal(result, expected)
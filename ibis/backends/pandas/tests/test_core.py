@@ -17,6 +17,7 @@ from ibis.backends.pandas.dispatch import (
     pre_execute,
 )
 from ibis.backends.pandas.execution import execute
+from ibis.expr.analysis import reduction_to_aggregation
 from ibis.expr.scope import Scope
 
 
@@ -195,3 +196,21 @@ def test_scope_look_up():
     scope = scope.merge_scope(Scope({one_day: 1}, None))
     assert scope.get_value(one_hour) is None
     assert scope.get_value(one_day) is not None
+
+
+def test_equal_tables_on_different_connections():
+    a = Backend().connect({'t': pd.DataFrame({'x': [1, 2, 3]})})
+    b = Backend().connect({'t': pd.DataFrame({'x': [100, 200, 300]})})
+    ta = a.table('t')
+    tb = b.table('t')
+
+    # both tables compare equal, analysis results for one must not be
+    # reused for the other
+    expr_a = ta[ta.x > ta.x.mean()]
+    expr_b = tb[tb.x > tb.x.mean()]
+    assert expr_a.execute().x.tolist() == [3]
+    assert expr_b.execute().x.tolist() == [300]
+
+    reduction_to_aggregation(ta.x.sum())
+    agg = reduction_to_aggregation(tb.x.sum())
+    assert agg.op().table.op().source is b
@@ -6,6 +6,11 @@ from pytest import mark, param
 import ibis.expr.datatypes as dt
 from ibis.udf.vectorized import reduction
 
+# build the pandas side as an array up front so `Series.isin` doesn't
+# convert the list on every call
+ISIN_VALUES = ('1', '7')
+ISIN_ARRAY = np.array(ISIN_VALUES, dtype=object)
+
 
 @reduction(input_type=[dt.double], output_type=dt.double)
 def mean_udf(s):
@@ -75,12 +80,19 @@ def test_aggregate(
     backend.assert_frame_equal(result, expected)
 
 
+@pytest.fixture(scope='module')
+def df_grouped(df):
+    # pandas caches the group indexer on the groupby object, so share it
+    # between parametrizations
+    return df.groupby('bigint_col')
+
+
 @pytest.mark.parametrize(
     ('result_fn', 'expected_fn', 'expected_col'),
     aggregate_test_params,
 )
 def test_aggregate_grouped(
-    backend, alltypes, df, result_fn, expected_fn, expected_col
+    backend, alltypes, df_grouped, result_fn, expected_fn, expected_col
 ):
     grouping_key_col = 'bigint_col'
 
@@ -94,22 +106,61 @@ def test_aggregate_grouped(
 
     # Note: Using `reset_index` to get the grouping key as a column
     expected = (
-        df.groupby(grouping_key_col)[expected_col]
-        .agg(expected_fn)
-        .rename('tmp')
-        .reset_index()
+        df_grouped[expected_col].agg(expected_fn).rename('tmp').reset_index()
     )
 
     # Row ordering may differ depending on backend, so sort on the
     # grouping key
-    result1 = result1.sort_values(by=grouping_key_col).reset_index(drop=True)
-    result2 = result2.sort_values(by=grouping_key_col).reset_index(drop=True)
-    expected = expected.sort_values(by=grouping_key_col).reset_index(drop=True)
+    result1 = result1.sort_values(by=grouping_key_col, ignore_index=True)
+    result2 = result2.sort_values(by=grouping_key_col, ignore_index=True)
+    expected = expected.sort_values(by=grouping_key_col, ignore_index=True)
 
     backend.assert_frame_equal(result1, expected)
     backend.assert_frame_equal(result2, expected)
 
 
+@pytest.fixture(
+    scope='module',
+    params=[
+        param((lambda _: None, lambda _: slice(None)), id='no_cond'),
+        param(
+            (
+                lambda t: t.string_col.isin(ISIN_VALUES),
+                lambda t: t.string_col.isin(ISIN_ARRAY),
+            ),
+            id='is_in',
+        ),
+    ],
+)
+def reduction_cond(request, alltypes, df):
+    ibis_cond, pandas_cond = request.param
+    return ibis_cond(alltypes), pandas_cond(df)
+
+
+def _mask(where):
+    """Turn a pandas condition into a ufunc ``where=`` argument."""
+    return True if isinstance(where, slice) else where.to_numpy()
+
+
+covar_corr_notimpl = pytest.mark.notimpl(
+    [
+        "clickhouse",
+        "dask",
+        "duckdb",
+        "impala",
+        "mysql",
+        "pandas",
+        "postgres",
+        "pyspark",
+        "sqlite",
+    ]
+)
+bitwise_marks = [
+    pytest.mark.notimpl(["dask"]),
+    pytest.mark.notyet(["impala", "pyspark"]),
+]
+
+
 @pytest.mark.parametrize(
     ('result_fn', 'expected_fn'),
     [
@@ -118,36 +169,6 @@ def test_aggregate_grouped(
             lambda t, where: len(t.bool_col[where].dropna()),
             id='count',
         ),
-        param(
-            lambda t, _: t.bool_col.any(),
-            lambda t, _: t.bool_col.any(),
-            id='any',
-        ),
-        param(
-            lambda t, _: t.bool_col.notany(),
-            lambda t, _: ~t.bool_col.any(),
-            id='notany',
-        ),
-        param(
-            lambda t, _: -t.bool_col.any(),
-            lambda t, _: ~t.bool_col.any(),
-            id='any_negate',
-        ),
-        param(
-            lambda t, _: t.bool_col.all(),
-            lambda t, _: t.bool_col.all(),
-            id='all',
-        ),
-        param(
-            lambda t, _: t.bool_col.notall(),
-            lambda t, _: ~t.bool_col.all(),
-            id='notall',
-        ),
-        param(
-            lambda t, _: -t.bool_col.all(),
-            lambda t, _: ~t.bool_col.all(),
-            id='all_negate',
-        ),
         param(
             lambda t, where: t.double_col.sum(where=where),
             lambda t, where: t.double_col[where].sum(),
@@ -192,41 +213,13 @@ def test_aggregate_grouped(
             lambda t, where: t.double_col.cov(t.float_col, where=where),
             lambda t, where: t.double_col[where].cov(t.float_col[where]),
             id='covar',
-            marks=[
-                pytest.mark.notimpl(
-                    [
-                        "clickhouse",
-                        "dask",
-                        "duckdb",
-                        "impala",
-                        "mysql",
-                        "pandas",
-                        "postgres",
-                        "pyspark",
-                        "sqlite",
-                    ]
-                )
-            ],
+            marks=covar_corr_notimpl,
         ),
         param(
             lambda t, where: t.double_col.corr(t.float_col, where=where),
             lambda t, where: t.double_col[where].corr(t.float_col[where]),
             id='corr',
-            marks=[
-                pytest.mark.notimpl(
-                    [
-                        "clickhouse",
-                        "dask",
-                        "duckdb",
-                        "impala",
-                        "mysql",
-                        "pandas",
-                        "postgres",
-                        "pyspark",
-                        "sqlite",
-                    ]
-                )
-            ],
+            marks=covar_corr_notimpl,
         ),
         param(
             lambda t, where: t.string_col.approx_nunique(where=where),
@@ -270,41 +263,33 @@ def test_aggregate_grouped(
         ),
         param(
             lambda t, where: t.bigint_col.bit_and(where=where),
-            lambda t, where: np.bitwise_and.reduce(t.bigint_col[where].values),
+            lambda t, where: np.bitwise_and.reduce(
+                t.bigint_col.to_numpy(dtype=np.int64),
+                where=_mask(where),
+                initial=-1,
+            ),
             id='bit_and',
-            marks=[
-                pytest.mark.notimpl(["dask"]),
-                pytest.mark.notyet(["impala", "pyspark"]),
-            ],
+            marks=bitwise_marks,
         ),
         param(
             lambda t, where: t.bigint_col.bit_or(where=where),
-            lambda t, where: np.bitwise_or.reduce(t.bigint_col[where].values),
+            lambda t, where: np.bitwise_or.reduce(
+                t.bigint_col.to_numpy(dtype=np.int64),
+                where=_mask(where),
+                initial=0,
+            ),
             id='bit_or',
-            marks=[
-                pytest.mark.notimpl(["dask"]),
-                pytest.mark.notyet(["impala", "pyspark"]),
-            ],
+            marks=bitwise_marks,
         ),
         param(
             lambda t, where: t.bigint_col.bit_xor(where=where),
-            lambda t, where: np.bitwise_xor.reduce(t.bigint_col[where].values),
+            lambda t, where: np.bitwise_xor.reduce(
+                t.bigint_col.to_numpy(dtype=np.int64),
+                where=_mask(where),
+                initial=0,
+            ),
             id='bit_xor',
-            marks=[
-                pytest.mark.notimpl(["dask"]),
-                pytest.mark.notyet(["impala", "pyspark"]),
-            ],
-        ),
-    ],
-)
-@pytest.mark.parametrize(
-    ('ibis_cond', 'pandas_cond'),
-    [
-        param(lambda _: None, lambda _: slice(None), id='no_cond'),
-        param(
-            lambda t: t.string_col.isin(['1', '7']),
-            lambda t: t.string_col.isin(['1', '7']),
-            id='is_in',
+            marks=bitwise_marks,
         ),
     ],
 )
@@ -314,13 +299,56 @@ def test_reduction_ops(
     df,
     result_fn,
     expected_fn,
-    ibis_cond,
-    pandas_cond,
+    reduction_cond,
 ):
-    expr = result_fn(alltypes, ibis_cond(alltypes))
+    ibis_cond, pandas_cond = reduction_cond
+    expr = result_fn(alltypes, ibis_cond)
     result = expr.execute()
 
-    expected = expected_fn(df, pandas_cond(df))
+    expected = expected_fn(df, pandas_cond)
+    np.testing.assert_allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    ('result_fn', 'expected_fn'),
+    [
+        param(
+            lambda t: t.bool_col.any(),
+            lambda t: t.bool_col.any(),
+            id='any',
+        ),
+        param(
+            lambda t: t.bool_col.notany(),
+            lambda t: ~t.bool_col.any(),
+            id='notany',
+        ),
+        param(
+            lambda t: -t.bool_col.any(),
+            lambda t: ~t.bool_col.any(),
+            id='any_negate',
+        ),
+        param(
+            lambda t: t.bool_col.all(),
+            lambda t: t.bool_col.all(),
+            id='all',
+        ),
+        param(
+            lambda t: t.bool_col.notall(),
+            lambda t: ~t.bool_col.all(),
+            id='notall',
+        ),
+        param(
+            lambda t: -t.bool_col.all(),
+            lambda t: ~t.bool_col.all(),
+            id='all_negate',
+        ),
+    ],
+)
+@mark.notimpl(["datafusion"])
+def test_bool_reductions(alltypes, df, result_fn, expected_fn):
+    # these ignore the filter, so they don't need to run for every condition
+    result = result_fn(alltypes).execute()
+    expected = expected_fn(df)
     np.testing.assert_allclose(result, expected)
 
 
@@ -340,6 +368,25 @@ def test_approx_median(alltypes):
     assert isinstance(result, float)
 
 
+def _pandas_group_concat(t, where):
+    strings = t.string_col
+    if not isinstance(where, slice):
+        strings = strings.where(where)
+
+    # cluster rows by group key so that each group is a contiguous slice,
+    # then join each slice once instead of dispatching a lambda per group
+    codes, keys = pd.factorize(t.bigint_col, sort=True)
+    order = np.argsort(codes, kind='stable')
+    values = strings.to_numpy()[order]
+    starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+
+    tmp = []
+    for group in np.split(values, starts[1:]):
+        group = group[pd.notna(group)]
+        tmp.append(','.join(group) if len(group) else np.nan)
+    return pd.DataFrame({'bigint_col': keys, 'tmp': tmp})
+
+
 @pytest.mark.parametrize(
     ('result_fn', 'expected_fn'),
     [
@@ -351,22 +398,7 @@ def test_approx_median(alltypes):
                 )
                 .sort_by('bigint_col')
             ),
-            lambda t, where: (
-                (
-                    t.assign(string_col=t.string_col.where(where))
-                    if not isinstance(where, slice)
-                    else t
-                )
-                .groupby('bigint_col')
-                .string_col.agg(
-                    lambda s: (
-                        np.nan if pd.isna(s).all() else ','.join(s.values)
-                    )
-                )
-                .rename('tmp')
-                .sort_index()
-                .reset_index()
-            ),
+            _pandas_group_concat,
             id='group_concat',
         )
     ],
@@ -376,8 +408,8 @@ def test_approx_median(alltypes):
     [
         param(lambda _: None, lambda _: slice(None), id='no_cond'),
         param(
-            lambda t: t.string_col.isin(['1', '7']),
-            lambda t: t.string_col.isin(['1', '7']),
+            lambda t: t.string_col.isin(ISIN_VALUES),
+            lambda t: t.string_col.isin(ISIN_ARRAY),
             marks=pytest.mark.notimpl(["dask", "pandas"]),
             id='is_in',
         ),
@@ -421,7 +453,9 @@ def test_topk_op(alltypes, df, result_fn, expected_fn):
     df = df.sort_values('string_col')
     result = result_fn(t).execute()
     expected = expected_fn(df)
-    assert all(result['count'].values == expected.values)
+    np.testing.assert_array_equal(
+        result['count'].to_numpy(), expected.to_numpy()
+    )
 
 
 @pytest.mark.parametrize(
@@ -455,8 +489,8 @@ def test_topk_filter_op(alltypes, df, result_fn, expected_fn):
 @pytest.mark.parametrize(
     'agg_fn',
     [
-        param(lambda s: list(s), id='agg_to_list'),
-        param(lambda s: np.array(s), id='agg_to_ndarray'),
+        param(lambda s: s.to_numpy().tolist(), id='agg_to_list'),
+        param(lambda s: np.asarray(s), id='agg_to_ndarray'),
     ],
 )
 @mark.notimpl(
@@ -515,7 +549,7 @@ def test_aggregate_mixed(backend, alltypes, df):
 
     @reduction(input_type=[dt.double], output_type=dt.Array(dt.double))
     def collect_udf(v):
-        return np.array(v)
+        return np.asarray(v)
 
     expr = alltypes.aggregate(
         sum_col=sum_udf(alltypes.double_col),
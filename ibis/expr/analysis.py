@@ -53,8 +53,18 @@ class Substitutor:
         We need a new cache per substitution call, otherwise we leak state
         across calls and end up incorrectly reusing other substitions' cache.
         """
-        cache = toolz.memoize(key=lambda args, kwargs: args[0]._key)
-        self.substitute = cache(self._substitute)
+        self.cache = {}
+
+    def substitute(self, expr, mapping):
+        key = id(expr)
+        try:
+            return self.cache[key][1]
+        except KeyError:
+            result = self._substitute(expr, mapping)
+            # keep `expr` alive so that its id can't be reused by another
+            # expression while the cache entry exists
+            self.cache[key] = expr, result
+            return result
 
     def _substitute(self, expr, mapping):
         """Substitute expressions with other expressions.
@@ -75,14 +85,10 @@ class Substitutor:
             if node.blocks():
                 return expr
 
-            new_args = list(node.args)
-            unchanged = True
-            for i, arg in enumerate(new_args):
-                if isinstance(arg, ir.Expr):
-                    new_arg = self.substitute(arg, mapping)
-                    unchanged = unchanged and new_arg is arg
-                    new_args[i] = new_arg
-            if unchanged:
+            new_args = [
+                self._substitute_arg(arg, mapping) for arg in node.args
+            ]
+            if all(map(operator.is_, new_args, node.args)):
                 return expr
             try:
                 new_node = type(node)(*new_args)
@@ -90,11 +96,23 @@ class Substitutor:
                 return expr
 
             new_expr = type(expr)(new_node)
-            if expr.has_name():
-                new_expr = new_expr.name(expr.get_name())
+            if node.has_resolved_name():
+                new_expr = new_expr.name(node.resolve_name())
 
             return new_expr
 
+    def _substitute_arg(self, arg, mapping):
+        if isinstance(arg, ir.Expr):
+            return self.substitute(arg, mapping)
+        elif isinstance(arg, (tuple, list)):
+            # sequences of expressions, e.g. the arguments of Coalesce
+            new_arg = [self._substitute_arg(x, mapping) for x in arg]
+            if all(map(operator.is_, new_arg, arg)):
+                return arg
+            return type(arg)(new_arg)
+        else:
+            return arg
+
 
 class ScalarAggregate:
     def __init__(self, expr):
@@ -133,14 +151,14 @@ class ScalarAggregate:
 
         new_op = type(node)(*subbed_args)
         new_expr = new_op.to_expr()
-        if expr.has_name():
-            new_expr = new_expr.name(name=expr.get_name())
+        if node.has_resolved_name():
+            new_expr = new_expr.name(name=node.resolve_name())
 
         return new_expr
 
 
 def has_multiple_bases(expr):
-    return toolz.count(find_immediate_parent_tables(expr)) > 1
+    return len(find_immediate_parent_tables(expr)) > 1
 
 
 def reduction_to_aggregation(expr):
@@ -155,22 +173,38 @@ def reduction_to_aggregation(expr):
     return agg
 
 
+# traversal callbacks run once per visited node, bind the traversal control
+# values and the most common return value once instead of looking them up
+# on `lin` every time
+_HALT = lin.halt
+_PROCEED = lin.proceed
+_PROCEED_NONE = (_PROCEED, None)
+
+
+def _find_table(expr):
+    if isinstance(expr, ir.Table):
+        return _HALT, expr
+    else:
+        return _PROCEED_NONE
+
+
 def find_immediate_parent_tables(expr):
     """Find every first occurrence of a :class:`ibis.expr.types.Table`
     object in `expr`.
 
     Parameters
     ----------
-    expr : ir.Expr
+    expr : ir.Expr or Iterable[ir.Expr]
 
-    Yields
-    ------
-    e : ir.Expr
+    Returns
+    -------
+    tuple[ir.Table, ...]
+        The tables in the order they are first found.
 
     Notes
     -----
     This function does not traverse into Table objects. This means that the
-    underlying PhysicalTable of a Selection will not be yielded, for example.
+    underlying PhysicalTable of a Selection will not be returned, for example.
 
     Examples
     --------
@@ -189,20 +223,27 @@ def find_immediate_parent_tables(expr):
         foo: r0.a + 1
     """
 
-    def finder(expr):
-        if isinstance(expr, ir.Table):
-            return lin.halt, expr
-        else:
-            return lin.proceed, None
-
-    return toolz.unique(lin.traverse(finder, expr))
+    # `lin.traverse` already visits each operation once, so the tables it
+    # yields are unique
+    return tuple(lin.traverse(_find_table, expr))
 
 
 def substitute_parents(expr, lift_memo=None, past_projection=True):
-    rewriter = ExprSimplifier(expr, block_projection=not past_projection)
+    rewriter = ExprSimplifier(
+        expr, block_projection=not past_projection, memo=lift_memo
+    )
     return rewriter.get_result()
 
 
+@functools.lru_cache(maxsize=None)
+def _is_lift_barrier(op_class):
+    # table nodes (selections included) are never rewritten by lifting, values
+    # and anything else are; resolved once per concrete operation class
+    return not issubclass(op_class, ops.Value) and issubclass(
+        op_class, (ops.TableNode, HasSchema)
+    )
+
+
 class ExprSimplifier:
 
     """
@@ -212,12 +253,26 @@ class ExprSimplifier:
     semantic result)
     """
 
-    def __init__(self, expr, block_projection=False):
+    def __init__(self, expr, block_projection=False, memo=None):
         self.expr = expr
         self.block_projection = block_projection
+        # maps (id(expr), block) to (expr, result); holding on to expr keeps
+        # its id from being reused by another expression
+        self.memo = {} if memo is None else memo
 
     def get_result(self):
-        expr = self.expr
+        return self._simplify(self.expr, self.block_projection)
+
+    def _simplify(self, expr, block):
+        key = id(expr), block
+        try:
+            return self.memo[key][1]
+        except KeyError:
+            result = self._rewrite(expr, block)
+            self.memo[key] = expr, result
+            return result
+
+    def _rewrite(self, expr, block):
         node = expr.op()
         if isinstance(node, ops.Literal):
             return expr
@@ -227,7 +282,7 @@ class ExprSimplifier:
         # table schema or is a derived field. If we've projected out of
         # something other than a physical table, then lifting should not occur
         if isinstance(node, ops.TableColumn):
-            result = self._lift_TableColumn(expr, block=self.block_projection)
+            result = self._lift_TableColumn(expr, block=block)
             if result is not expr:
                 return result
         # Temporary hacks around issues addressed in #109
@@ -238,9 +293,7 @@ class ExprSimplifier:
 
         lifted_args = []
         for arg in node.args:
-            lifted_arg, unch_arg = self._lift_arg(
-                arg, block=self.block_projection
-            )
+            lifted_arg, unch_arg = self._lift_arg(arg, block=block)
             lifted_args.append(lifted_arg)
 
             unchanged = unchanged and unch_arg
@@ -252,8 +305,8 @@ class ExprSimplifier:
         lifted_node = type(node)(*lifted_args)
 
         result = type(expr)(lifted_node)
-        if isinstance(expr, ir.Value) and expr.has_name():
-            result = result.name(expr.get_name())
+        if isinstance(expr, ir.Value) and node.has_resolved_name():
+            result = result.name(node.resolve_name())
 
         return result
 
@@ -274,24 +327,21 @@ class ExprSimplifier:
         if arg is None:
             return arg, True
 
-        if util.is_iterable(arg):
-            result = list(map(_lift, arg))
+        # expressions and plain sequences are by far the most common
+        # arguments, so check for them before the generic iterable test
+        if isinstance(arg, ir.Expr):
+            result = _lift(arg)
+        elif type(arg) in (tuple, list) or util.is_iterable(arg):
+            result = [_lift(x) for x in arg]
         else:
             result = _lift(arg)
 
         return result, not changed
 
     def lift(self, expr, block):
-        op = expr.op()
-
-        if isinstance(op, ops.Value):
-            return self._sub(expr, block=block)
-        elif isinstance(op, ops.Selection):
+        if _is_lift_barrier(type(expr.op())):
             return expr
-        elif isinstance(op, (ops.TableNode, HasSchema)):
-            return expr
-        else:
-            return self._sub(expr, block=block)
+        return self._sub(expr, block=block)
 
     def _lift_TableColumn(self, expr, block):
         node = expr.op()
@@ -317,8 +367,7 @@ class ExprSimplifier:
 
     def _sub(self, expr, block):
         # catchall recursive rewriter
-        helper = ExprSimplifier(expr, block_projection=block)
-        return helper.get_result()
+        return self._simplify(expr, block)
 
 
 def get_mutation_exprs(
@@ -385,11 +434,16 @@ def get_mutation_exprs(
 
     columns = table.columns
     if overwriting_cols_to_expr:
-        return [
-            overwriting_cols_to_expr.get(column, table[column])
-            for column in columns
-            if overwriting_cols_to_expr.get(column, table[column]) is not None
-        ] + non_overwriting_exprs
+        mutation_exprs = []
+        for column in columns:
+            try:
+                expr = overwriting_cols_to_expr[column]
+            except KeyError:
+                # only build a column expression when it's actually kept
+                expr = table[column]
+            if expr is not None:
+                mutation_exprs.append(expr)
+        return mutation_exprs + non_overwriting_exprs
 
     table_expr: ir.Expr = table
     return [table_expr] + exprs
@@ -407,13 +461,15 @@ def apply_filter(expr, predicates):
     elif isinstance(op, ops.Aggregation):
         # Potential fusion opportunity
         # GH1344: We can't sub in things with correlated subqueries
+        substitutor = Substitutor()
+        mapping = {op.table.op(): expr}
         simplified_predicates = tuple(
             # Originally this line tried substituting op.table in for expr, but
             # that is too aggressive in the presence of filters that occur
             # after aggregations.
             #
             # See https://github.com/ibis-project/ibis/pull/3341 for details
-            sub_for(predicate, [(op.table, expr)])
+            substitutor.substitute(predicate, mapping)
             if not is_reduction(predicate)
             else predicate
             for predicate in predicates
@@ -455,8 +511,10 @@ def _filter_selection(expr, predicates):
         # Potential fusion opportunity. The predicates may need to be
         # rewritten in terms of the child table. This prevents the broken
         # ref issue (described in more detail in #59)
+        substitutor = Substitutor()
+        mapping = {expr.op(): op.table}
         simplified_predicates = tuple(
-            sub_for(predicate, [(expr, op.table)])
+            substitutor.substitute(predicate, mapping)
             if not is_reduction(predicate)
             else predicate
             for predicate in predicates
@@ -532,43 +590,65 @@ class _PushdownValidate:
     def _validate_projection(self, expr):
         is_valid = False
         node = expr.op()
+        # `expr` doesn't change across selections, so lift it at most once
+        lifted_table = None
 
         for val in self.parent.selections:
+            val_op = val.op()
             if (
-                isinstance(val.op(), ops.PhysicalTable)
+                isinstance(val_op, ops.PhysicalTable)
                 and node.name in val.schema()
             ):
                 is_valid = True
             elif (
-                isinstance(val.op(), ops.TableColumn)
+                isinstance(val_op, ops.TableColumn)
                 and node.name == val.get_name()
             ):
                 # Aliased table columns are no good
-                col_table = val.op().table.op()
+                col_table = val_op.table.op()
+
+                if col_table.equals(node.table.op()):
+                    is_valid = True
+                    continue
 
-                lifted_node = substitute_parents(
-                    expr,
-                    past_projection=False,
-                ).op()
+                if lifted_table is None:
+                    lifted_node = substitute_parents(
+                        expr,
+                        past_projection=False,
+                    ).op()
+                    lifted_table = lifted_node.table.op()
 
-                is_valid = col_table.equals(
-                    node.table.op()
-                ) or col_table.equals(lifted_node.table.op())
+                is_valid = col_table.equals(lifted_table)
 
         return is_valid
 
 
 def windowize_function(expr, w=None):
+    # `w` is the same for the whole walk, so the result for a subexpression
+    # only depends on the subexpression itself; maps id(x) to (x, result)
+    # to keep `x` alive while its id is in use
+    memo = {}
+
     def _windowize(x, w):
-        if not isinstance(x.op(), ops.Window):
+        key = id(x)
+        try:
+            return memo[key][1]
+        except KeyError:
+            result = _windowize_node(x, w)
+            memo[key] = x, result
+            return result
+
+    def _windowize_node(x, w):
+        node = x.op()
+        if not isinstance(node, ops.Window):
             walked = _walk(x, w)
         else:
-            window_arg, window_w = x.op().args
+            window_arg, window_w = node.args
             walked_child = _walk(window_arg, w)
 
             if walked_child is not window_arg:
                 op = ops.Window(walked_child, window_w)
-                walked = op.to_expr().name(x.get_name())
+                walked = op.to_expr().name(node.resolve_name())
             else:
                 walked = x
 
@@ -602,8 +682,8 @@ def windowize_function(expr, w=None):
         if not unchanged:
             new_op = type(op)(*windowed_args)
             expr = new_op.to_expr()
-            if x.has_name():
-                expr = expr.name(x.get_name())
+            if op.has_resolved_name():
+                expr = expr.name(op.resolve_name())
             return expr
         else:
             return x
@@ -661,9 +741,11 @@ class Projector:
                 resolved = clean_exprs
             else:
                 # if any expressions aren't exactly equivalent then don't try
-                # to fuse them
+                # to fuse them, most are the very same object so check that
+                # first
                 if any(
-                    not res_root_root.equals(res_root)
+                    res_root_root is not res_root
+                    and not res_root_root.equals(res_root)
                     for res_root_root, res_root in zip(resolved, clean_exprs)
                 ):
                     return None
@@ -694,7 +776,7 @@ class Projector:
                 have_root = False
                 for root_sel in root_selections:
                     # Don't add the * projection twice
-                    if root_sel.equals(root_table):
+                    if root_sel is root_table or root_sel.equals(root_table):
                         fused_exprs.append(root_table)
                         have_root = True
                         continue
@@ -722,18 +804,37 @@ class Projector:
         return None
 
 
-def find_first_base_table(expr):
-    def predicate(expr):
+def _find_first(expr, found, blocked=()):
+    """Return the first expression whose operation is an instance of `found`.
+
+    This is a depth-first, left-to-right search visiting every operation
+    once, the same order as :func:`ibis.expr.lineage.traverse`, but without
+    going through a callback and a generator for each node. Operations that
+    are instances of `blocked` are not descended into.
+    """
+    exprs = expr if isinstance(expr, collections.abc.Iterable) else [expr]
+    todo = [arg for arg in reversed(list(exprs)) if isinstance(arg, ir.Expr)]
+    seen = set()
+    while todo:
+        expr = todo.pop()
         op = expr.op()
-        if isinstance(op, ops.TableNode):
-            return lin.halt, expr
-        else:
-            return lin.proceed, None
+        if op in seen:
+            continue
+        seen.add(op)
+
+        if isinstance(op, found):
+            return expr
+        if not isinstance(op, blocked):
+            todo.extend(
+                arg
+                for arg in reversed(list(op.flat_args()))
+                if isinstance(arg, ir.Expr)
+            )
+    return None
 
-    try:
-        return next(lin.traverse(predicate, expr))
-    except StopIteration:
-        return None
+
+def find_first_base_table(expr):
+    return _find_first(expr, ops.TableNode)
 
 
 def _find_root_table(expr):
@@ -742,10 +843,8 @@ def _find_root_table(expr):
     if isinstance(op, ops.Selection):
         # remove predicates and sort_keys, so that child tables are considered
         # equivalent even if their predicates and sort_keys are not
-        return lin.proceed, op.__class__(
-            table=op.table,
-            selections=op.selections,
-        )
+        root = op.__class__(table=op.table, selections=op.selections)
+        return lin.proceed, root
     elif op.blocks():
         return lin.halt, op
     else:
@@ -753,17 +852,21 @@ def _find_root_table(expr):
 
 
 def shares_all_roots(exprs, parents):
-    # unique table dependencies of exprs and parents
-    exprs_deps = set(lin.traverse(_find_root_table, exprs))
+    # unique table dependencies of parents, exprs' dependencies are checked
+    # lazily so that the traversal stops at the first foreign root
     parents_deps = set(lin.traverse(_find_root_table, parents))
-    return exprs_deps <= parents_deps
+    return all(
+        dep in parents_deps for dep in lin.traverse(_find_root_table, exprs)
+    )
 
 
 def shares_some_roots(exprs, parents):
-    # unique table dependencies of exprs and parents
-    exprs_deps = set(lin.traverse(_find_root_table, exprs))
+    # unique table dependencies of parents, exprs' dependencies are checked
+    # lazily so that the traversal stops at the first shared root
     parents_deps = set(lin.traverse(_find_root_table, parents))
-    return bool(exprs_deps & parents_deps)
+    return any(
+        dep in parents_deps for dep in lin.traverse(_find_root_table, exprs)
+    )
 
 
 @util.deprecated(version="4.0", instead="")
@@ -805,13 +908,7 @@ def find_source_table(expr):  # pragma: no cover
     NotImplementedError: More than one base table not implemented
     """
 
-    def finder(expr):
-        if isinstance(expr, ir.Table):
-            return lin.halt, expr
-        else:
-            return lin.proceed, None
-
-    first_tables = lin.traverse(finder, expr.op().flat_args())
+    first_tables = lin.traverse(_find_table, expr.op().flat_args())
     options = list(toolz.unique(first_tables, key=operator.methodcaller('op')))
 
     if len(options) > 1:
@@ -851,13 +948,27 @@ def flatten_predicate(expr):
     r0.b == 'foo'
     """
 
-    def predicate(expr):
-        if isinstance(expr.op(), ops.And):
-            return lin.proceed, None
+    # an explicit left-to-right depth-first walk, equivalent to
+    # `lin.traverse` but without its generic per-node dispatch
+    predicates = []
+    seen = set()
+    todo = [expr] if isinstance(expr, ir.BooleanColumn) else []
+    while todo:
+        expr = todo.pop()
+        op = expr.op()
+        if op in seen:
+            continue
+        seen.add(op)
+
+        if isinstance(op, ops.And):
+            todo.extend(
+                arg
+                for arg in reversed(op.args)
+                if isinstance(arg, ir.BooleanColumn)
+            )
         else:
-            return lin.halt, expr
-
-    return list(lin.traverse(predicate, expr, type=ir.BooleanColumn))
+            predicates.append(expr)
+    return predicates
 
 
 def _is_ancestor(parent, child):  # pragma: no cover
@@ -884,13 +995,7 @@ def _is_ancestor(parent, child):  # pragma: no cover
 
 
 def is_analytic(expr):
-    def predicate(expr):
-        if isinstance(expr.op(), (ops.Reduction, ops.Analytic)):
-            return lin.halt, True
-        else:
-            return lin.proceed, None
-
-    return any(lin.traverse(predicate, expr))
+    return _find_first(expr, (ops.Reduction, ops.Analytic)) is not None
 
 
 def is_reduction(expr):
@@ -921,17 +1026,8 @@ def is_reduction(expr):
     -------
     check output : bool
     """
-
-    def predicate(expr):
-        if isinstance(expr.op(), ops.Reduction):
-            return lin.halt, True
-        elif isinstance(expr.op(), ops.TableNode):
-            # don't go below any table nodes
-            return lin.halt, None
-        else:
-            return lin.proceed, None
-
-    return any(lin.traverse(predicate, expr))
+    # don't go below any table nodes
+    return _find_first(expr, ops.Reduction, blocked=ops.TableNode) is not None
 
 
 def is_scalar_reduction(expr):
@@ -945,43 +1041,85 @@ _ANY_OP_MAPPING = {
 
 
 def find_predicates(expr, flatten=True):
-    def predicate(expr):
-        if isinstance(expr, ir.BooleanColumn):
-            if flatten and isinstance(expr.op(), ops.And):
-                return lin.proceed, None
-            else:
-                return lin.halt, expr
-        return lin.proceed, None
+    # same depth-first, left-to-right order as lin.traverse, collecting
+    # into a list directly instead of going through a callback per node
+    exprs = expr if isinstance(expr, collections.abc.Iterable) else [expr]
+    todo = [arg for arg in reversed(list(exprs)) if isinstance(arg, ir.Expr)]
+    seen = set()
+    predicates = []
+    while todo:
+        expr = todo.pop()
+        op = expr.op()
+        if op in seen:
+            continue
+        seen.add(op)
+
+        if isinstance(expr, ir.BooleanColumn) and not (
+            flatten and isinstance(op, ops.And)
+        ):
+            predicates.append(expr)
+        else:
+            todo.extend(
+                arg
+                for arg in reversed(list(op.flat_args()))
+                if isinstance(arg, ir.Expr)
+            )
+    return predicates
 
-    return list(lin.traverse(predicate, expr))
 
+class _SubqueryCounter:
+    """Traversal callback counting the table expressions used in a query."""
 
-def find_subqueries(expr: ir.Expr) -> Counter:
-    def predicate(
-        counts: Counter, expr: ir.Expr
+    __slots__ = ("counts", "visits")
+
+    def __init__(self) -> None:
+        # plain dicts are cheaper to increment than Counter
+        self.counts: dict[ops.TableNode, int] = {}
+        self.visits: dict[ops.Node, int] = {}
+
+    def __call__(
+        self, expr: ir.Expr
     ) -> tuple[Sequence[ir.Table] | bool, None]:
         op = expr.op()
+        counts = self.counts
 
         if isinstance(op, ops.Join):
-            return [op.left, op.right], None
+            control = [op.left, op.right]
         elif isinstance(op, ops.PhysicalTable):
-            return lin.halt, None
+            control = _HALT
         elif isinstance(op, ops.SelfReference):
-            return lin.proceed, None
+            control = _PROCEED
         elif isinstance(op, (ops.Selection, ops.Aggregation)):
-            counts[op] += 1
-            return [op.table], None
+            counts[op] = counts.get(op, 0) + 1
+            control = [op.table]
         elif isinstance(op, ops.TableNode):
-            counts[op] += 1
-            return lin.proceed, None
+            counts[op] = counts.get(op, 0) + 1
+            control = _PROCEED
         elif isinstance(op, ops.TableColumn):
-            return op.table.op() not in counts, None
+            control = op.table.op() not in counts
         else:
-            return lin.proceed, None
+            control = _PROCEED
+
+        visits = self.visits
+        visits[op] = nvisits = visits.get(op, 0) + 1
+        # every walk of a subtree visits a subset of what the previous walk
+        # visited, so after two walks all of them have been counted twice
+        # and walking it again can't change which subqueries are shared
+        if nvisits > 2:
+            return _HALT, None
+        return control, None
+
+
+def find_subqueries(expr: ir.Expr) -> Counter:
+    """Count how often each table expression is used in `expr`.
 
-    counts = Counter()
+    Counts of 0, 1 and 2 are exact; a shared subtree stops being walked
+    after its second visit, so counts above that may be lower than the
+    number of uses.
+    """
+    counter = _SubqueryCounter()
     iterator = lin.traverse(
-        functools.partial(predicate, counts),
+        counter,
         expr,
         # keep duplicates so we can determine where an expression is used
         # more than once
@@ -989,15 +1127,61 @@ def find_subqueries(expr: ir.Expr) -> Counter:
     )
     # consume the iterator
     collections.deque(iterator, maxlen=0)
-    return counts
+    return Counter(counter.counts)
+
+
+def _find_tables_and_predicates(expr):
+    """Return the immediate parent tables and the flattened predicates of
+    `expr` from a single walk.
+
+    Every stack entry records whether it is still reachable by the table
+    search, the predicate search or both, and each search keeps its own
+    set of visited operations, so the results are exactly those of
+    :func:`find_immediate_parent_tables` and :func:`find_predicates`.
+    """
+    tables = []
+    predicates = []
+    tables_seen = set()
+    predicates_seen = set()
+    todo = [(expr, True, True)]
+    while todo:
+        expr, for_tables, for_predicates = todo.pop()
+        op = expr.op()
+
+        if for_tables:
+            if op in tables_seen:
+                for_tables = False
+            else:
+                tables_seen.add(op)
+                if isinstance(expr, ir.Table):
+                    tables.append(expr)
+                    for_tables = False
+
+        if for_predicates:
+            if op in predicates_seen:
+                for_predicates = False
+            else:
+                predicates_seen.add(op)
+                if isinstance(expr, ir.BooleanColumn) and not isinstance(
+                    op, ops.And
+                ):
+                    predicates.append(expr)
+                    for_predicates = False
+
+        if for_tables or for_predicates:
+            todo.extend(
+                (arg, for_tables, for_predicates)
+                for arg in reversed(list(op.flat_args()))
+                if isinstance(arg, ir.Expr)
+            )
+    return tables, predicates
 
 
 def _make_any(
     expr,
     any_op_class: type[ops.Any] | type[ops.NotAny],
 ):
-    tables = list(find_immediate_parent_tables(expr))
-    predicates = find_predicates(expr, flatten=True)
+    tables, predicates = _find_tables_and_predicates(expr)
 
     if len(tables) > 1:
         op = _ANY_OP_MAPPING[any_op_class](
@@ -1040,30 +1224,77 @@ def _rewrite_filter_subqueries(_, expr, **kwargs):
 @_rewrite_filter.register(ops.Alias)
 def _rewrite_filter_alias(op, _, name: str | None = None, **kwargs):
     """Rewrite filters on aliases."""
-    arg = op.arg
-    return _rewrite_filter(
-        arg.op(),
-        arg,
-        name=name if name is not None else op.name,
-        **kwargs,
-    )
+    # peel off nested aliases here instead of recursing once per alias,
+    # the outermost name wins
+    while isinstance(op, ops.Alias):
+        if name is None:
+            name = op.name
+        arg = op.arg
+        op = arg.op()
+    return _rewrite_filter.dispatch(type(op))(op, arg, name=name, **kwargs)
 
 
 @_rewrite_filter.register(ops.Value)
 def _rewrite_filter_value(op, expr, **kwargs):
-    """Recursively apply filter rewriting on operations."""
-    args = op.args
-    visited = [
-        _rewrite_filter(arg.op(), arg, **kwargs)
-        if isinstance(arg, ir.Expr)
-        else arg
-        for arg in args
-    ]
-    if all(map(operator.is_, visited, args)):
-        return expr
-    else:
-        return (
-            op.__class__(*visited)
-            .to_expr()
-            .name("tmp" if not expr.has_name() else expr.get_name())
-        )
+    """Recursively apply filter rewriting on operations.
+
+    Nested value operations are walked with an explicit stack instead of
+    recursing through `_rewrite_filter`, so deep predicates don't exhaust
+    the interpreter stack.  Results are memoized by operation, which
+    compares structurally, so repeated subexpressions are rewritten once
+    and share the same result.
+    """
+    # maps each operation to its rewritten expression and whether that
+    # differs from the original; equal operations can come from distinct
+    # expressions, so identity alone can't tell whether anything changed
+    memo = {}
+    dispatch = _rewrite_filter.dispatch
+
+    stack = [(op, expr, False)]
+    while stack:
+        node, node_expr, expanded = stack.pop()
+        if node in memo:
+            continue
+        args = node.args
+        if not expanded:
+            stack.append((node, node_expr, True))
+            for arg in args:
+                if not isinstance(arg, ir.Expr):
+                    continue
+                arg_op = arg.op()
+                if arg_op in memo:
+                    continue
+                # look the implementation up once per child and call it
+                # directly rather than going back through the dispatcher
+                handler = dispatch(type(arg_op))
+                if handler is _rewrite_filter_subqueries:
+                    memo[arg_op] = arg, False
+                elif handler is _rewrite_filter_value:
+                    stack.append((arg_op, arg, False))
+                else:
+                    result = handler(arg_op, arg, **kwargs)
+                    memo[arg_op] = result, result is not arg
+            continue
+
+        # only copy the arguments once one of them has actually changed
+        visited = None
+        for i, arg in enumerate(args):
+            if isinstance(arg, ir.Expr):
+                new_arg, changed = memo[arg.op()]
+                if not changed:
+                    new_arg = arg
+            else:
+                new_arg = arg
+            if visited is None:
+                if new_arg is arg:
+                    continue
+                visited = list(args[:i])
+            visited.append(new_arg)
+
+        if visited is None:
+            memo[node] = node_expr, False
+        else:
+            name = node.resolve_name() if node.has_resolved_name() else "tmp"
+            memo[node] = node.__class__(*visited).to_expr().name(name), True
+    result, changed = memo[op]
+    return result if changed else expr
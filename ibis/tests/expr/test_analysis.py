@@ -174,6 +174,15 @@ def test_join_table_choice():
     assert L.sub_for(predicate, [(t, t.op().table)]).equals(predicate)
 
 
+def test_sub_for_sequence_args():
+    t = ibis.table(dict(a="int64", b="int64"), name="t")
+    s = ibis.table(dict(a="int64", b="int64"), name="s")
+    expr = ibis.coalesce(t.a, t.b) + t.a
+    result = L.sub_for(expr, [(t, s)])
+    expected = ibis.coalesce(s.a, s.b) + s.a
+    assert result.equals(expected)
+
+
 def test_is_ancestor_analytic():
     x = ibis.table(ibis.schema([('col', 'int32')]), 'x')
     with_filter_col = x[x.columns + [ibis.null().name('filter')]]
@@ -308,3 +317,56 @@ def test_agg_selection_does_not_share_roots():
 
     with pytest.raises(com.RelationError, match="Selection expressions"):
         gb.aggregate(n=n)
+
+
+def test_find_tables_and_predicates_matches_separate_walks():
+    t = ibis.table(dict(a="int64", c="boolean"), name="t")
+    s = ibis.table(dict(a="int64", d="boolean"), name="s")
+    sel = t[t.c]
+    expr = ((t.a > 0) & ((t.a < s.a) & sel.c)) & (t.a > 0)
+
+    tables, predicates = L._find_tables_and_predicates(expr)
+
+    expected_tables = L.find_immediate_parent_tables(expr)
+    expected_predicates = L.find_predicates(expr, flatten=True)
+    assert [t.op() for t in tables] == [t.op() for t in expected_tables]
+    assert [p.op() for p in predicates] == [
+        p.op() for p in expected_predicates
+    ]
+
+
+def test_rewrite_filter_shares_equal_reductions():
+    t = ibis.table(dict(a="int64", b="int64"), name="t")
+    pred = (t.a > t.a.mean()) & (t.b > t.a.mean())
+
+    result = L._rewrite_filter(pred.op(), pred)
+
+    left, right = (
+        arg.op().arg.op().right for arg in result.op().arg.op().args
+    )
+    assert left is right
+
+    unchanged = (t.a > 0) & (t.a > 0)
+    assert L._rewrite_filter(unchanged.op(), unchanged) is unchanged
+
+
+def test_is_reduction_non_expr_input():
+    t = ibis.table(dict(a="int64"), name="t")
+    assert not L.is_reduction(5)
+    assert not L.is_analytic(5)
+    assert L.is_reduction([t.a.sum()])
+    assert L.is_analytic([t.a.sum()])
+    assert not L.is_reduction([t.a])
+
+
+def test_aggregate_non_expr_metric():
+    t = ibis.table(dict(a="int64"), name="t")
+    with pytest.raises(com.ExpressionError):
+        t.aggregate(5)
+
+
+def test_find_immediate_parent_tables_iterable():
+    t = ibis.table(dict(a="int64"), name="t")
+    s = ibis.table(dict(b="int64"), name="s")
+    tables = L.find_immediate_parent_tables([t.a, s.b, t.a + 1])
+    assert [table.op() for table in tables] == [t.op(), s.op()]
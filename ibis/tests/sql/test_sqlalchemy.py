@@ -223,6 +223,24 @@ def test_named_expr(sa_functional_alltypes, functional_alltypes):
     _check(expr, expected)
 
 
+def test_repeated_subexpression(sa_functional_alltypes, functional_alltypes):
+    # equal subexpressions built separately share a translation
+    t = functional_alltypes
+    expr = t[
+        (t.double_col * 2).name('foo'),
+        ((t.double_col * 2) + (t.double_col * 2)).name('bar'),
+    ]
+
+    sd = sa_functional_alltypes.c.double_col
+    expected = sa.select(
+        [
+            (sd * L(2)).label('foo'),
+            (sd * L(2) + sd * L(2)).label('bar'),
+        ]
+    )
+    _check(expr, expected)
+
+
 @pytest.mark.parametrize(
     ("expr_fn", "expected_fn"),
     [